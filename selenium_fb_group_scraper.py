@@ -1,15 +1,29 @@
 import csv
+import hashlib
+import json
 import os
 import random
 import re
+import subprocess
 import sys
+import threading
 import time
+import urllib.parse
 import webbrowser
 import html as html_lib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
+# Everything the scraper writes lives next to this script so the output
+# location is always predictable. Resolved once; Path.resolve() stats every
+# path component, so hot paths should not repeat it.
+SCRIPT_DIR = Path(__file__).resolve().parent
+IMG_DIR = SCRIPT_DIR / "fb_images"
+IMG_DIR.mkdir(exist_ok=True)
+CSV_PATH = SCRIPT_DIR / "fb_group_posts_selenium.csv"
+
 # Global flag controlled by UI/CLI to filter posts by Sri Lankan phone numbers
 SL_FILTER_ENABLED = False
 
@@ -26,10 +40,28 @@ SL_PHONE_REGEX = re.compile(r"(?:\+94\d{8,9}|0(?:3|7)\d{7,8})")
 # If we cut the URL at ".jpg" or ".png", the request will usually fail
 # (HTTP 403 / 404). Therefore the regex keeps the optional query part.
 FB_IMAGE_URL_REGEX = re.compile(
-    r"https?://[^\"'\\s]+?\\.(?:jpg|jpeg|png|webp)(?:\\?[^\"'\\s]*)?",
+    r"https?://[^\"'\s]+?\.(?:jpg|jpeg|png|webp)(?:\?[^\"'\s]*)?",
     re.IGNORECASE,
 )
 
+# Fallback HTML-to-text helpers (see html_to_text): strip tags, then collapse
+# runs of whitespace in a single pass.
+TAG_STRIP_REGEX = re.compile(r"<[^>]+>")
+WHITESPACE_REGEX = re.compile(r"\s+")
+
+# Netscape cookies.txt fields are tab-separated, but some exporters use runs
+# of spaces. One split pattern covers both; maxsplit keeps any whitespace in
+# the trailing value field intact.
+NETSCAPE_SPLIT_REGEX = re.compile(r"[ \t]+")
+
+# Flattens newlines for single-line table cells; str.translate does it in
+# one C-level pass instead of chained replace() copies.
+NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# Platform folder opener, resolved once at import (Windows goes through
+# os.startfile instead).
+FOLDER_OPENER = "open" if sys.platform == "darwin" else "xdg-open"
+
 
 def contains_sl_phone(text: str) -> bool:
     if not text:
@@ -39,18 +71,79 @@ def contains_sl_phone(text: str) -> bool:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter, Retry
 except ImportError:
     print("The 'requests' package is not installed.")
     print("Install it with:")
     print("    python -m pip install requests")
     sys.exit(1)
 
+# Shared session so image downloads reuse TCP/TLS connections (Keep-Alive)
+# instead of paying a fresh handshake per image. Retries cover the transient
+# 429/5xx responses Facebook's CDN returns under load.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+HTTP_SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+
+# Number of concurrent image downloads per batch.
+IMAGE_DOWNLOAD_WORKERS = 8
+
+# Map the response Content-Type to a file extension. fbcdn URLs often carry no
+# usable extension, so trusting the header beats guessing from the URL.
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+# One browser identity shared by the Selenium session and the image
+# downloader. Facebook is strict and may return HTTP 403 for requests that
+# look like bots, so mimic a real browser as much as possible.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Frozen base headers for image requests; per-post copies only add
+# Cookie/Referer on top.
+IMAGE_REQUEST_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+# Number of posts whose images are processed concurrently. Together with
+# IMAGE_DOWNLOAD_WORKERS this bounds the total number of open sockets.
+POST_DOWNLOAD_WORKERS = 4
+
+# Optional: selectolax is a C HTML parser that beats the regex fallback for
+# HTML-to-text conversion; script/style nodes are dropped explicitly in
+# html_to_text (its text() would otherwise include them, just like the
+# regex fallback does). The scraper works without it.
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.action_chains import ActionChains
     from selenium.webdriver.common.by import By
-    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
 except ImportError:
     print("The 'selenium' package is not installed.")
     print("Install it with:")
@@ -58,6 +151,47 @@ except ImportError:
     sys.exit(1)
 
 
+# One warm Chrome instance reused across scrapes. Launching chromedriver and
+# a fresh profile costs seconds per run; keeping the browser alive amortizes
+# that and preserves the logged-in session between scrapes.
+_DRIVER: Optional[webdriver.Chrome] = None
+_DRIVER_COOKIES_ATTACHED = False
+_DRIVER_LOCK = threading.Lock()
+
+
+def get_or_create_driver(chrome_options: Options) -> webdriver.Chrome:
+    """
+    Return the cached Chrome driver, creating a new one if none exists or the
+    previous session has died.
+    """
+    global _DRIVER, _DRIVER_COOKIES_ATTACHED
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            try:
+                _ = _DRIVER.current_url  # cheap probe: is the session alive?
+                return _DRIVER
+            except Exception:
+                _DRIVER = None
+        _DRIVER = webdriver.Chrome(options=chrome_options)
+        _DRIVER_COOKIES_ATTACHED = False
+        return _DRIVER
+
+
+def shutdown_driver() -> None:
+    """
+    Quit and forget the cached driver. Called on app/CLI teardown.
+    """
+    global _DRIVER, _DRIVER_COOKIES_ATTACHED
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            try:
+                _DRIVER.quit()
+            except Exception:
+                pass
+            _DRIVER = None
+            _DRIVER_COOKIES_ATTACHED = False
+
+
 def load_netscape_cookies(cookies_path: Path) -> List[Dict[str, str]]:
     """
     Load cookies from a Netscape cookies.txt file.
@@ -71,12 +205,9 @@ def load_netscape_cookies(cookies_path: Path) -> List[Dict[str, str]]:
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            parts = line.split("\t")
+            parts = NETSCAPE_SPLIT_REGEX.split(line, maxsplit=6)
             if len(parts) != 7:
-                # Some exporters use spaces instead of tabs
-                parts = line.split()
-                if len(parts) != 7:
-                    continue
+                continue
 
             domain, flag, path, secure, expiration, name, value = parts
             cookies.append(
@@ -91,10 +222,92 @@ def load_netscape_cookies(cookies_path: Path) -> List[Dict[str, str]]:
     return cookies
 
 
+# Compact the seen log once it holds this many lines; appends in between are
+# cheap and the occasional rewrite keeps the file from growing without bound.
+SEEN_LOG_COMPACT_THRESHOLD = 10000
+
+
+def compact_seen_log(state_file: Path, seen: set) -> None:
+    """
+    Rewrite the seen log from the deduplicated in-memory set.
+
+    Writes to a temp file in the same directory, fsyncs, then atomically
+    replaces the log, so a crash mid-write can never leave a truncated file.
+    """
+    tmp = state_file.with_suffix(state_file.suffix + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        for url in seen:
+            f.write(url + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, state_file)
+
+
+def load_seen_urls(state_file: Path) -> set:
+    """
+    Load previously collected post URLs from an append-only log
+    (one URL per line). Missing file simply means nothing seen yet.
+    """
+    if not state_file.is_file():
+        return set()
+    line_count = 0
+    seen = set()
+    with state_file.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                line_count += 1
+                seen.add(line)
+    if line_count > SEEN_LOG_COMPACT_THRESHOLD and line_count > len(seen):
+        compact_seen_log(state_file, seen)
+    return seen
+
+
+def append_seen_urls(state_file: Path, new_urls: List[str]) -> None:
+    """
+    Append newly collected post URLs to the seen log. Appending keeps the
+    per-run I/O proportional to the number of new posts instead of rewriting
+    the whole state on every run.
+    """
+    if not new_urls:
+        return
+    with state_file.open("a", encoding="utf-8") as f:
+        f.write("\n".join(new_urls) + "\n")
+
+
 def attach_cookies(driver: webdriver.Chrome, cookies: List[Dict[str, str]]) -> None:
     # We must be on the base domain before adding cookies
     driver.get("https://www.facebook.com/")
-    time.sleep(3 + random.uniform(0.5, 2.0))
+    try:
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+    except Exception:
+        # Page took unusually long; try adding the cookies anyway.
+        pass
+
+    # One CDP command sets the whole batch, instead of one WebDriver
+    # round-trip per cookie (dozens for a Facebook export).
+    try:
+        driver.execute_cdp_cmd(
+            "Network.setCookies",
+            {
+                "cookies": [
+                    {
+                        "domain": c["domain"],
+                        "path": c["path"],
+                        "name": c["name"],
+                        "value": c["value"],
+                        "secure": c["secure"],
+                    }
+                    for c in cookies
+                ]
+            },
+        )
+        return
+    except Exception as e:
+        print(f"[DEBUG] CDP Network.setCookies failed ({e}); adding one by one.")
+
     for c in cookies:
         cookie = {
             "domain": c["domain"],
@@ -109,23 +322,151 @@ def attach_cookies(driver: webdriver.Chrome, cookies: List[Dict[str, str]]) -> N
             print(f"[DEBUG] Failed to add cookie {c['name']}: {e}")
 
 
+def html_to_text(html: str) -> str:
+    """
+    Best-effort plain text from raw HTML (used when Selenium's .text is empty).
+
+    Prefers selectolax when available; otherwise strips tags with a simple
+    regex and collapses whitespace.
+    """
+    if HTMLParser is not None:
+        try:
+            tree = HTMLParser(html)
+            # text() includes script/style payloads — and FB article HTML is
+            # full of inline JS/JSON blobs — so drop those nodes first.
+            for node in tree.css("script, style"):
+                node.decompose()
+            body = tree.body
+            if body is not None:
+                return body.text(separator=" ", strip=True)
+        except Exception:
+            pass
+    rough = TAG_STRIP_REGEX.sub(" ", html)
+    return WHITESPACE_REGEX.sub(" ", rough).strip()
+
+
+# One anchored pass over a group URL: captures the canonical base (scheme
+# optional, www/web/m hosts), the group id/slug, and whatever trails it
+# (query/fragment excluded). Replaces the chain of split()/in checks that
+# normalize_group_url and _extract_group_id_or_slug used to share.
+GROUP_URL_REGEX = re.compile(
+    r"^(?P<base>(?:https?://)?(?:www\.|web\.|m\.)?facebook\.com"
+    r"/groups/(?P<gid>[^/?#]+))(?P<rest>[^?#]*)"
+)
+
+
 def normalize_group_url(raw: str) -> str:
     raw = raw.strip()
-    if "/groups/" in raw:
-        # Ensure we hit the posts tab
-        if "?" in raw:
-            raw = raw.split("?", 1)[0]
-        if not raw.endswith("/"):
-            raw += "/"
-        if "/posts/" not in raw:
-            raw += "posts"
-    return raw
+    m = GROUP_URL_REGEX.match(raw)
+    if not m:
+        # Bare IDs/slugs (and anything unrecognized) pass through untouched.
+        return raw
+    rest = m.group("rest")
+    if "/posts/" in rest:
+        # Already a post permalink: keep it, minus query/fragment.
+        url = m.group("base") + rest
+        return url if url.endswith("/") else url + "/"
+    # Otherwise land on the group's posts tab.
+    return m.group("base") + "/posts"
+
+
+# Walks every article container in-page and returns [{href, text, html,
+# imgs}, ...] in a single WebDriver round-trip. Link discovery mirrors the
+# old per-article XPath cascade: exact group id/slug first, then generic
+# groups+posts, then any /posts/ link. Entries without a usable link come
+# back as null so Python can report them by index. Articles whose link was
+# found are tagged data-scraped in the same pass and excluded from later
+# walks, so per-scroll work scales with *new* articles, not the whole page;
+# link-less articles stay untagged in case their permalink renders later.
+# innerHTML — often
+# hundreds of KB per article — is serialized over the wire only when the
+# caller needs it for filtering, or when the article has no visible
+# text/images and the HTML is the only fallback source.
+EXTRACT_POSTS_JS = """
+var gid = arguments[0];
+var needHtml = arguments[1];
+var kw = arguments[2] || '';
+var results = [];
+// Build the exact-gid selector once, escaping the user-supplied value so a
+// stray quote/bracket cannot make querySelector throw; on any failure the
+// generic strategies below still run.
+var gidSel = null;
+if (gid) {
+    try {
+        var g = CSS.escape(gid);
+        gidSel = 'a[href*="/groups/' + g + '/posts/"], ' +
+            'a[href*="/groups/' + g + '/permalink/"]';
+    } catch (e) {
+        gidSel = null;
+    }
+}
+var articles = document.querySelectorAll(
+    'div[role="article"]:not([data-scraped])');
+for (var k = 0; k < articles.length; k++) {
+    var art = articles[k];
+    var link = null;
+    if (gidSel) {
+        try {
+            link = art.querySelector(gidSel);
+        } catch (e) {
+            link = null;
+        }
+    }
+    if (!link) {
+        link = art.querySelector('a[href*="/groups/"][href*="/posts/"]');
+    }
+    if (!link) {
+        link = art.querySelector('a[href*="/posts/"]');
+    }
+    if (!link || !link.href) {
+        results.push(null);
+        continue;
+    }
+    art.setAttribute('data-scraped', '1');
+    var imgs = Array.from(art.querySelectorAll('img'))
+        .map(function(i) { return i.currentSrc || i.src; })
+        .filter(function(s) { return s && s.indexOf('data:') !== 0; });
+    var text = (art.innerText || '').slice(0, 4000);
+    var kwMatch = true;
+    if (kw) {
+        kwMatch = text.toLowerCase().indexOf(kw) !== -1 ||
+            (art.innerHTML || '').toLowerCase().indexOf(kw) !== -1;
+    }
+    results.push({
+        href: link.href,
+        text: text,
+        html: (needHtml || !text || !imgs.length) ? (art.innerHTML || '') : '',
+        imgs: imgs,
+        kwMatch: kwMatch
+    });
+}
+return {posts: results, height: document.body.scrollHeight};
+"""
+
+# Installs a MutationObserver (once per page) that keeps
+# window.__fbArticleCount in sync with the number of article containers.
+# The scroll loop waits on this counter growing, so its cadence follows
+# actual content arrival instead of fixed sleeps.
+ARTICLE_OBSERVER_JS = """
+if (!window.__fbArticleObserver) {
+    var update = function() {
+        window.__fbArticleCount =
+            document.querySelectorAll('div[role="article"]').length;
+    };
+    window.__fbArticleObserver = new MutationObserver(update);
+    window.__fbArticleObserver.observe(
+        document.body, {childList: true, subtree: true});
+    update();
+}
+"""
 
 
 def extract_posts_from_dom(
     driver: webdriver.Chrome,
     group_id_or_slug: str,
-) -> List[Dict[str, str]]:
+    need_html: bool = True,
+    keyword: str = "",
+) -> Tuple[List[Dict[str, str]], int]:
     """
     Extract posts from the live DOM using Selenium.
 
@@ -141,113 +482,87 @@ def extract_posts_from_dom(
       - post_text (visible text of the article)
       - html (innerHTML of the article, used as a fallback for phone detection)
       - image_urls (all <img> src values within the article)
+
+    The whole walk happens inside one execute_script call (EXTRACT_POSTS_JS),
+    so the WebDriver cost per scroll is a single round-trip regardless of how
+    many articles are on the page. With need_html=False, innerHTML is only
+    serialized for articles that lack visible text or images (where it is the
+    only fallback), which keeps the payload small when no filter needs it.
+    A lowercased keyword, when given, is matched against the article text and
+    HTML inside V8 and reported as "kw_match", so Python never allocates the
+    lowercased copies.
+
+    Returns (posts, page_height): the script also reports
+    document.body.scrollHeight so the scroll loop's bottom-of-page check does
+    not need its own round-trip.
     """
     posts: List[Dict[str, str]] = []
 
+    gid = (group_id_or_slug or "").strip()
+
     try:
-        articles = driver.find_elements(By.XPATH, "//div[@role='article']")
+        payload = (
+            driver.execute_script(EXTRACT_POSTS_JS, gid, need_html, keyword) or {}
+        )
     except Exception as e:
         print(f"[DEBUG] Failed to locate post containers: {e}")
-        return posts
-
-    print(f"[DEBUG] Found {len(articles)} candidate article elements on the page.")
-
-    gid = (group_id_or_slug or "").strip()
-
-    for idx, art in enumerate(articles, start=1):
-        href = ""
-        link_el = None
-
-        # Strategy 1: explicit group id/slug in the URL
-        if gid:
-            try:
-                xpath = (
-                    ".//a[contains(@href, '/groups/"
-                    + gid
-                    + "/posts/') or contains(@href, '/groups/"
-                    + gid
-                    + "/permalink/')]"
-                )
-                link_el = art.find_element(By.XPATH, xpath)
-            except Exception:
-                link_el = None
+        return posts, 0
 
-        # Strategy 2: generic groups + posts pattern
-        if link_el is None:
-            try:
-                link_el = art.find_element(
-                    By.XPATH,
-                    ".//a[contains(@href, '/groups/') and contains(@href, '/posts/')]",
-                )
-            except Exception:
-                link_el = None
+    raw_articles = payload.get("posts") or []
+    page_height = int(payload.get("height") or 0)
 
-        # Strategy 3: any link with "/posts/"
-        if link_el is None:
-            try:
-                link_el = art.find_element(By.XPATH, ".//a[contains(@href, '/posts/')]")
-            except Exception:
-                link_el = None
-
-        if link_el is None:
-            snippet = (art.text or "").replace("\n", " ")[:80]
-            print(f"[DEBUG] Article #{idx}: no post link found. Snippet='{snippet}'")
-            continue
+    print(f"[DEBUG] Found {len(raw_articles)} candidate article elements on the page.")
 
-        href = link_el.get_attribute("href") or ""
-        if not href:
+    for idx, data in enumerate(raw_articles, start=1):
+        if not data or not data.get("href"):
+            print(f"[DEBUG] Article #{idx}: no post link found.")
             continue
 
-        text = art.text or ""
-        html = ""
-        try:
-            html = art.get_attribute("innerHTML") or ""
-        except Exception:
-            html = ""
+        href = data["href"]
+        text = data.get("text") or ""
+        html = data.get("html") or ""
 
-        # If Selenium's .text is empty (common with some FB layouts), try to
+        # If the visible text is empty (common with some FB layouts), try to
         # derive a plain-text snippet from the raw HTML so the CSV has content.
         if not text and html:
-            # Strip tags with a simple regex-based approach
-            rough = re.sub(r"<[^>]+>", " ", html)
-            # Collapse whitespace
-            rough = " ".join(rough.split())
-            text = rough
+            text = html_to_text(html)[:4000]
 
-        image_urls: List[str] = []
-        try:
-            # 1) Regula <=img> tags
-            img_elements = art.find_elements(By.XPATH, ".//img")
-            for img in img_elements:
-                src = img.get_attribute("src") or ""
-               tinue
-                if src.startswith("data:"):
-                    # Skip inline SVG/icons here; we'll look for real media URLs below.
-                    continue
-                if src not in image_urls:
-                    image_urls.append(src)
-        except Exception:
-            pass
+        # Dedupe with a dict so membership checks are O(1) while keeping the
+        # original order (downloads are numbered by position).
+        image_urls: Dict[str, None] = {}
+        for src in data.get("imgs") or []:
+            image_urls[src] = None
 
         # As a fallback, scan the HTML for any direct image URLs (fbcdn, scontent, etc.).
         # We also unescape HTML entities (&amp; → &) to get a valid URL.
-        if html:
-            for match in FB_IMAGE_URL_REGEX.findall(html):
-                clean_url = html_lib.unescape(match)
-                if clean_url not in image_urls:
-                    image_urls.append(clean_url)
+        # Only worth the regex pass when the <img> walk came up empty — when it
+        # found photos, the scan mostly re-discovers the same URLs plus
+        # low-value thumbnails buried in JSON blobs.
+        if html and not image_urls:
+            # FB pages repeat the same URL across JSON blobs dozens of times.
+            # Check the raw match first so duplicates skip the unescape
+            # allocation, and only unescape when an entity is present.
+            raw_seen = set()
+            for match in FB_IMAGE_URL_REGEX.finditer(html):
+                raw = match.group(0)
+                if raw in raw_seen:
+                    continue
+                raw_seen.add(raw)
+                clean = html_lib.unescape(raw) if "&" in raw else raw
+                image_urls[clean] = None
 
         posts.append(
             {
                 "post_url": href,
-                "post_text": text[:4000],
+                "post_text": text,
                 "html": html,
-                "image_urls": image_urls,
+                "image_urls": list(image_urls),
+                "kw_match": bool(data.get("kwMatch", True)),
             }
         )
 
     print(f"[DEBUG] extract_posts_from_dom: returning {len(posts)} post(s).")
-    return posts
+    return posts, page_height
 
 
 def compute_dynamic_delay(iter_index: int, base: float = 2.5) -> float:
@@ -271,12 +586,179 @@ def build_cookie_header(cookies: List[Dict[str, str]]) -> str:
     """
     if not cookies:
         return ""
-    parts = []
-    for c in cookies:
-        if not c.get("name"):
-            continue
-        parts.append(f"{c['name']}={c['value']}")
-    return "; ".join(parts)
+    return "; ".join(
+        f"{c['name']}={c['value']}" for c in cookies if c.get("name")
+    )
+
+
+def build_cookie_dict(cookies: List[Dict[str, str]]) -> Dict[str, str]:
+    """
+    Build a name->value dict from Netscape cookies, e.g. for
+    requests.Session.cookies.update(...).
+    """
+    if not cookies:
+        return {}
+    return {c["name"]: c["value"] for c in cookies if c.get("name")}
+
+
+def sniff_image_ext(buf: bytes) -> Optional[str]:
+    """
+    Guess an image extension from leading magic bytes. Used when the response
+    carries no recognizable Content-Type.
+    """
+    if buf.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if buf.startswith(b"\x89PNG"):
+        return ".png"
+    if buf[:4] == b"RIFF" and buf[8:12] == b"WEBP":
+        return ".webp"
+    if buf.startswith(b"GIF8"):
+        return ".gif"
+    return None
+
+
+# Facebook reuses the same avatars/reactions/static thumbnails across many
+# posts, with only cache-buster query strings varying. Cache downloads by
+# query-stripped URL so each distinct image hits the network once, and
+# persist the mapping so repeated runs skip files already on disk.
+IMAGE_INDEX_PATH = IMG_DIR / "_index.json"
+
+_IMAGE_CACHE: Dict[str, str] = {}
+_IMAGE_CACHE_LOCK = threading.Lock()
+_IMAGE_CACHE_LOADED = False
+
+
+def _canonical_image_url(url: str) -> str:
+    """Strip the query string (cache-busters, size hints) for cache keying."""
+    return urllib.parse.urlsplit(url)._replace(query="").geturl()
+
+
+def _load_image_index() -> None:
+    """Populate the in-memory image cache from fb_images/_index.json (once)."""
+    global _IMAGE_CACHE_LOADED
+    with _IMAGE_CACHE_LOCK:
+        if _IMAGE_CACHE_LOADED:
+            return
+        _IMAGE_CACHE_LOADED = True
+        try:
+            with IMAGE_INDEX_PATH.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                _IMAGE_CACHE.update(
+                    (k, v) for k, v in data.items()
+                    if isinstance(k, str) and isinstance(v, str)
+                )
+            print(f"[DEBUG] Loaded {len(_IMAGE_CACHE)} cached image path(s).")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[DEBUG] Could not read image index: {e}")
+
+
+def _save_image_index() -> None:
+    """Write the image cache back to fb_images/_index.json."""
+    with _IMAGE_CACHE_LOCK:
+        snapshot = dict(_IMAGE_CACHE)
+    try:
+        with IMAGE_INDEX_PATH.open("w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+    except Exception as e:
+        print(f"[DEBUG] Could not write image index: {e}")
+
+
+class TokenBucket:
+    """
+    Minimal thread-safe token bucket. acquire() blocks until a token is
+    available, so callers sharing one bucket stay under `rate` requests per
+    second sustained while short bursts up to `capacity` pass untouched.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Caps the parallel download workers at a sustained 10 images/s (bursts of
+# 20). Tripping fbcdn throttling costs far more in retries than the pacing
+# costs in throughput.
+IMAGE_RATE_LIMITER = TokenBucket(rate=10.0, capacity=20.0)
+
+
+def download_image(
+    url: str,
+    dest_base: Path,
+    headers: Dict[str, str],
+    session: Optional[requests.Session] = None,
+) -> Optional[str]:
+    """
+    Download a single image using the shared pooled session. dest_base is the
+    target path without extension; the real extension comes from the response
+    Content-Type. Returns the absolute local path on success, None on failure.
+    """
+    sess = session or HTTP_SESSION
+    try:
+        IMAGE_RATE_LIMITER.acquire()
+        resp = sess.get(url, headers=headers, timeout=30, stream=True)
+        if resp.status_code != 200:
+            print(
+                f"[DEBUG] Failed to download image {url}: "
+                f"HTTP {resp.status_code}"
+            )
+            # Streamed responses hold their connection until closed; release
+            # it back to the pool instead of waiting on GC.
+            resp.close()
+            return None
+        content_type = resp.headers.get("Content-Type", "").split(";")[0].strip()
+        ext = CONTENT_TYPE_EXTENSIONS.get(content_type, "")
+        # Stream straight to disk instead of buffering the whole image in
+        # memory; 64KB chunks keep syscall count low for multi-MB photos.
+        # The first chunk doubles as a magic-byte sample when the header
+        # did not identify the format.
+        chunks = resp.iter_content(chunk_size=65536)
+        first = next(chunks, b"")
+        if not ext:
+            ext = sniff_image_ext(first) or ".jpg"
+        dest = dest_base.with_suffix(ext)
+        # Two workers can race on the same hashed name when posts share an
+        # image; stream into a per-worker temp file and os.replace it in so
+        # the final path only ever holds one complete byte stream (same
+        # idiom as compact_seen_log / save_posts_to_csv).
+        tmp = dest.with_name(
+            f"{dest.name}.{os.getpid()}-{threading.get_ident()}.part"
+        )
+        try:
+            with tmp.open("wb", buffering=65536) as f:
+                if first:
+                    f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp, dest)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
+        # IMG_DIR is already absolute, so no per-file resolve() is needed.
+        return str(dest)
+    except Exception as e:
+        print(f"[DEBUG] Exception downloading image {url}: {e}")
+        return None
 
 
 def download_images_for_posts(
@@ -285,103 +767,139 @@ def download_images_for_posts(
 ) -> None:
     """
     Download images for each post and attach 'image_paths' (semicolon-separated)
-    to each post dict. Images are saved under fb_images/post_{i}_img{j}.jpg
+    to each post dict. Images are saved under fb_images/img_<urlhash>.<ext>
+    with the extension taken from the response Content-Type; the name derives
+    from the query-stripped URL so the same image always maps to the same
+    file and a cached path can never be overwritten with different content.
+
+    Each post's images are fetched concurrently through a thread pool so a
+    batch of N images costs roughly one round-trip instead of N.
     """
     if not posts:
         return
 
-    # Always save images next to this script, in a fixed "fb_images" folder
-    script_dir = Path(__file__).resolve().parent
-    img_dir = script_dir / "fb_images"
-    img_dir.mkdir(exist_ok=True)
+    # Text-only scrapes (common with the phone filter) get no pools, no
+    # index load — just the empty column every consumer expects.
+    if not any(p.get("image_urls") for p in posts):
+        for post in posts:
+            post["image_paths"] = ""
+        return
+
+    _load_image_index()
 
-    headers_base = {}
+    headers_base = dict(IMAGE_REQUEST_HEADERS)
     if cookies:
         cookie_header = build_cookie_header(cookies)
         if cookie_header:
             headers_base["Cookie"] = cookie_header
 
-    # Try to mimic a real browser as much as possible. Facebook is strict and
-    # may return HTTP 403 for image requests that look like bots.
-    headers_base.setdefault(
-        "User-Agent",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    )
-    headers_base.setdefault("Accept", "image/avif,image/webp,image/apng,image/*,*/*;q=0.8")
-    headers_base.setdefault("Accept-Language", "en-US,en;q=0.9")
-    headers_base.setdefault("Connection", "keep-alive")
-
-    for i, post in enumerate(posts, start=1):
+    def _process_post(item) -> None:
+        i, post = item
         image_urls = post.get("image_urls") or []
-        local_paths: List[str] = []
 
         if not image_urls:
             print(
                 f"[DEBUG] Post #{i} ({post.get('post_url','')}) has no image URLs "
                 f"to download."
             )
-            post["image_paths"]//www.facebook.com/"
+            post["image_paths"] = ""
+            return
+
+        post_url = post.get("post_url") or "https://www.facebook.com/"
         headers = dict(headers_base)
         headers["Referer"] = post_url
 
-        for j, url in enumerate(image_urls, start=1):
+        tasks = []
+        for url in image_urls:
             # Skip data: URIs (SVG icons, inline images, etc.) which are not real files
             if url.startswith("data:"):
                 print(f"[DEBUG] Skipping inline image data URI for post {i}")
                 continue
-            try:
-                resp = requests.get(url, headers=headers, timeout=20)
-                if resp.status_code != 200:
-                    print(
-                        f"[DEBUG] Failed to download image {url}: "
-                        f"HTTP {resp.status_code}"
-                    )
-                    continue
-                ext = ".jpg"
-                filename = img_dir / f"post_{i}_img{j}{ext}"
-                with filename.open("wb") as f:
-                    f.write(resp.content)
-                local_paths.append(str(filename.resolve()))
-            except Exception as e:
-                print(f"[DEBUG] Exception downloading image {url}: {e}")
-                continue
-        post["image_paths"] = ";".join(local_paths)
-
-
-def save_posts_to_csv(posts: List[Dict[str, str]], out_path: Path) -> None:
+            tasks.append(url)
+
+        def _fetch_one(url):
+            canonical = _canonical_image_url(url)
+            with _IMAGE_CACHE_LOCK:
+                cached = _IMAGE_CACHE.get(canonical)
+            if cached and Path(cached).exists():
+                return cached
+            # Name the file from the canonical URL, not the post/image
+            # position: positional names change between runs, which would
+            # let a new download overwrite a file the persisted index still
+            # points at.
+            digest = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+            path = download_image(url, IMG_DIR / f"img_{digest}", headers)
+            if path:
+                with _IMAGE_CACHE_LOCK:
+                    _IMAGE_CACHE[canonical] = path
+            return path
+
+        results = image_executor.map(_fetch_one, tasks)
+        post["image_paths"] = ";".join(p for p in results if p)
+
+    # Two-level concurrency: several posts in flight at once, and each post's
+    # images fetched in parallel through the shared image pool. Each worker
+    # only mutates its own post dict, so no locking is required.
+    with ThreadPoolExecutor(max_workers=IMAGE_DOWNLOAD_WORKERS) as image_executor:
+        with ThreadPoolExecutor(max_workers=POST_DOWNLOAD_WORKERS) as post_executor:
+            list(post_executor.map(_process_post, enumerate(posts, start=1)))
+
+    _save_image_index()
+
+
+def save_posts_to_csv(
+    posts: List[Dict[str, str]],
+    out_path: Path,
+    append: bool = False,
+) -> None:
     """
     Save posts to CSV with columns: post_url, post_text, image_paths.
+
+    With append=True, rows are added to an existing file and the header is
+    only written when the file is new or empty, so repeated/batch runs can
+    accumulate results instead of overwriting earlier ones.
     """
     if not posts:
         return
 
-    fieldnames = ["post_url", "post_text", "image_paths"]
-    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for p in posts:
-            writer.writerow(
-                {
-                    "post_url": p.get("post_url", ""),
-                    "post_text": p.get("post_text", ""),
-                    "image_paths": p.get("image_paths", ""),
-                }
-            )
+    mode = "a" if append else "w"
+    write_header = (
+        not append or not out_path.exists() or out_path.stat().st_size == 0
+    )
+    # Only a fresh file gets the BOM; appending utf-8-sig mid-file would
+    # inject a stray BOM between rows.
+    encoding = "utf-8-sig" if write_header else "utf-8"
+
+    # Full rewrites go to a sibling tmp file swapped in via os.replace, so a
+    # crash mid-write never leaves a torn CSV behind (same pattern as
+    # compact_seen_log). Appends have to write in place.
+    target = out_path if append else out_path.with_name(out_path.name + ".tmp")
+
+    # A 1MB buffer batches the row writes into a handful of write() syscalls
+    # instead of one per 8KB default-buffer flush.
+    with target.open(mode, newline="", encoding=encoding, buffering=1 << 20) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        if write_header:
+            writer.writerow(["post_url", "post_text", "image_paths"])
+        writer.writerows(
+            (p.get("post_url", ""), p.get("post_text", ""), p.get("image_paths", ""))
+            for p in posts
+        )
+        if target is not out_path:
+            f.flush()
+            os.fsync(f.fileno())
+
+    if target is not out_path:
+        os.replace(target, out_path)
 
 
 def _extract_group_id_or_slug(group_input: str) -> str:
     """
     Extract numeric ID or slug from a group URL or return the input as-is.
     """
-    gid = group_input.strip()
-    if "facebook.com" in gid and "/groups/" in gid:
-        tail = gid.split("/groups/", 1)[1]
-        for sep in ("?", "#", "/"):
-            if sep in tail:
-                tail = tail.split(sep, 1)[0]
-        gid = tail
-    return gid
+    raw = group_input.strip()
+    m = GROUP_URL_REGEX.match(raw)
+    return m.group("gid") if m else raw
 
 
 def selenium_collect_posts(
@@ -390,34 +908,64 @@ def selenium_collect_posts(
     max_posts: int,
     cookies: Optional[List[Dict[str, str]]] = None,
     only_sl_phones: bool = False,
+    state_file: Optional[Path] = None,
 ) -> List[Dict[str, str]]:
     """
     Core Selenium scraping routine (no GUI, no CSV). Returns a list of post dicts:
     - post_url
     - post_text
     - image_urls (list)
+
+    When state_file is given, URLs already present in that log are skipped and
+    newly collected URLs are appended to it, so repeated runs only pick up
+    posts they have not seen before.
     """
     keyword = (keyword or "").strip().lower()
     group_url = normalize_group_url(group_input)
     gid = _extract_group_id_or_slug(group_input)
+    # innerHTML only matters as a haystack for the phone filter now that the
+    # keyword match runs in-page; without it, skip shipping HTML entirely.
+    need_html = only_sl_phones
 
     print(f"[INFO] Normalized group URL: {group_url}")
     print(f"[INFO] Using group identifier for parsing: {gid}")
 
     chrome_options = Options()
     chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    # The DOM pass only needs text and image *URLs* — the photos themselves
+    # are downloaded separately via requests — so let Chrome skip fetching
+    # images/fonts and the usual background chatter. FB still inlines src
+    # attributes, and the innerHTML regex fallback catches the rest.
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        },
     )
-
-    driver = webdriver.Chrome(options=chrome_options)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    # Return from driver.get on DOMContentLoaded instead of window load —
+    # FB feeds keep streaming below-fold content long after the posts we
+    # care about are in the DOM. The explicit WebDriverWaits still guard
+    # actual content readiness.
+    chrome_options.page_load_strategy = "eager"
+
+    global _DRIVER_COOKIES_ATTACHED
+    driver = get_or_create_driver(chrome_options)
 
     try:
-        if cookies:
+        if cookies and not _DRIVER_COOKIES_ATTACHED:
             attach_cookies(driver, cookies)
+            _DRIVER_COOKIES_ATTACHED = True
             driver.get(group_url)
             print("[INFO] Browser opened with your cookies applied.")
+        elif cookies:
+            # The warm browser still carries the cookies from a previous run.
+            driver.get(group_url)
         else:
             print("[INFO] No cookies provided. A browser window will open.")
             driver.get(group_url)
@@ -430,27 +978,45 @@ def selenium_collect_posts(
         )
 
         # Wait (up to ~5 minutes) for the user to log in and open the group page.
-        max_wait_seconds = 300
-        start_wait = time.time()
-        while time.time() - start_wait < max_wait_seconds:
-            try:
-                current_url = driver.current_url
-            except Exception:
-                current_url = ""
-            if "/groups/" in (current_url or ""):
-                break
-            time.sleep(3)
+        try:
+            WebDriverWait(driver, 300, poll_frequency=1.0).until(
+                EC.url_contains("/groups/")
+            )
+        except Exception:
+            print("[WARN] Timed out waiting for a group URL; trying to scrape anyway.")
 
-        time.sleep(5)
+        # Wait for the first post containers to render instead of a fixed sleep.
+        try:
+            WebDriverWait(driver, 30).until(
+                EC.presence_of_element_located((By.XPATH, "//div[@role='article']"))
+            )
+        except Exception:
+            print("[DEBUG] No article elements appeared within 30s; continuing.")
+
+        try:
+            driver.execute_script(ARTICLE_OBSERVER_JS)
+        except Exception as e:
+            print(f"[DEBUG] Could not install article observer: {e}")
 
         print("[INFO] Scrolling and collecting posts via Selenium...")
+        # Bound method avoids a global + attribute lookup per call in the
+        # per-post filter below.
+        sl_search = SL_PHONE_REGEX.search
         collected: List[Dict[str, str]] = []
-        seen_urls = set()
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        actions = ActionChains(driver)
+        seen_urls = load_seen_urls(state_file) if state_file else set()
+        if seen_urls:
+            print(f"[INFO] Loaded {len(seen_urls)} previously seen post URL(s).")
+        # Page height rides along with each extraction call, so the
+        # bottom-of-page check costs no extra round-trips.
+        last_height: Optional[int] = None
+
+        stale_scrolls = 0
 
         for scroll_idx in range(25):
-            posts = extract_posts_from_dom(driver, gid)
+            collected_before = len(collected)
+            posts, page_height = extract_posts_from_dom(
+                driver, gid, need_html=need_html, keyword=keyword
+            )
 
             for p in posts:
                 url = p["post_url"]
@@ -458,17 +1024,25 @@ def selenium_collect_posts(
                     continue
                 seen_urls.add(url)
 
-                text_lower = p["post_text"].lower()
-                html_lower = (p.get("html") or "").lower()
-
-                # Sri Lankan phone filter first (if enabled)
-                if only_sl_phones and not (contains_sl_phone(text_lower) or contains_sl_phone(html_lower)):
+                # Sri Lankan phone filter first (if enabled). The phone pattern
+                # is all digits, so it can run on the raw strings without the
+                # lowercasing pass.
+                if only_sl_phones and not (
+                    sl_search(p["post_text"])
+                    or sl_search(p.get("html") or "")
+                ):
                     continue
 
-                # Keyword filter (if provided)
-                if keyword and (keyword not in text_lower and keyword not in html_lower):
+                # Keyword filter (if provided) was evaluated in-page against
+                # the article text and HTML, so no lowercased copies are
+                # allocated here.
+                if keyword and not p.get("kw_match"):
                     continue
 
+                # The HTML and match flag have served their purpose; don't
+                # keep hundreds of KB per post alive in the results.
+                p.pop("html", None)
+                p.pop("kw_match", None)
                 collected.append(p)
                 print(f"[DEBUG] Collected post #{len(collected)}: {url}")
 
@@ -478,31 +1052,54 @@ def selenium_collect_posts(
             if len(collected) >= max_posts:
                 break
 
-            # Human-like scroll: move mouse randomly, then scroll
-            try:
-                actions.move_by_offset(
-                    random.randint(-50, 50), random.randint(-30, 30)
-                ).perform()
-            except Exception:
-                pass
+            if page_height == last_height:
+                print("[INFO] Reached bottom of page or no new content.")
+                break
+            last_height = page_height
 
-            driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
+            prev_article_count = driver.execute_script(
+                "return window.__fbArticleCount || 0"
+            )
 
-            # Dynamic delay between scrolls
-            pause = compute_dynamic_delay(scroll_idx, base=2.5)
-            time.sleep(pause)
+            # One RPC per scroll: jump to the bottom and fire the scroll
+            # event FB's lazy-loader listens for. The old mouse-jiggle +
+            # END-key pair cost two extra round-trips and triggered nothing
+            # the scroll event does not.
+            driver.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight);"
+                "window.dispatchEvent(new Event('scroll'));"
+            )
 
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                print("[INFO] Reached bottom of page or no new content.")
-                break
-            last_height = new_height
+            if len(collected) > collected_before:
+                stale_scrolls = 0
+            else:
+                stale_scrolls += 1
+
+            # Wait for the in-page observer to report new articles instead of
+            # sleeping a fixed interval. When nothing arrives within the
+            # window, fall back to the dynamic pause, doubled (up to a cap)
+            # while scrolls come back empty — groups load in bursts, so
+            # waiting longer gives lazy-loading a chance.
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.5).until(
+                    lambda d: d.execute_script("return window.__fbArticleCount || 0")
+                    > prev_article_count
+                )
+            except Exception:
+                pause = compute_dynamic_delay(scroll_idx, base=2.5)
+                if stale_scrolls:
+                    pause = min(pause * (2 ** stale_scrolls), 20.0)
+                time.sleep(pause)
 
         print(f"[INFO] Finished. Collected {len(collected)} post(s) matching filter.")
+        if state_file:
+            append_seen_urls(state_file, [p["post_url"] for p in collected])
         return collected
 
     finally:
-        driver.quit()
+        # Keep the browser warm for the next scrape; shutdown_driver() owns
+        # the actual teardown.
+        pass
 
 
 def main():
@@ -539,13 +1136,18 @@ def main():
 
     only_sl = sl_only_str in {"y", "yes"}
 
-    collected = selenium_collect_posts(
-        group_input=group_input,
-        keyword=keyword,
-        max_posts=max_posts,
-        cookies=cookies or None,
-        only_sl_phones=only_sl,
-    )
+    try:
+        collected = selenium_collect_posts(
+            group_input=group_input,
+            keyword=keyword,
+            max_posts=max_posts,
+            cookies=cookies or None,
+            only_sl_phones=only_sl,
+        )
+    finally:
+        # The CLI is one-shot, so close the browser as soon as collection is
+        # done — including when it fails partway.
+        shutdown_driver()
 
     if not collected:
         print("[INFO] No posts collected, nothing to save.")
@@ -555,13 +1157,10 @@ def main():
     download_images_for_posts(collected, cookies=cookies or None)
 
     # Always save CSV next to this script so the folder is predictable
-    script_dir = Path(__file__).resolve().parent
-    out_path = script_dir / "fb_group_posts_selenium.csv"
-
-    save_posts_to_csv(collected, out_path)
-    print(f"[INFO] Saved results to {out_path}")
-    print(f"[INFO] Images (if any) are in: {script_dir / 'fb_images'}")
-    print(f"[INFO] You can open this folder in Explorer: {script_dir}")
+    save_posts_to_csv(collected, CSV_PATH)
+    print(f"[INFO] Saved results to {CSV_PATH}")
+    print(f"[INFO] Images (if any) are in: {IMG_DIR}")
+    print(f"[INFO] You can open this folder in Explorer: {SCRIPT_DIR}")
 
     # For users who run the script by double-clicking the .py file on Windows,
     # keep the console window open so they can read the messages.
@@ -575,7 +1174,6 @@ def main():
 # ------------------ Advanced Tkinter GUI wrapper ------------------ #
 
 try:
-    import threading
     import tkinter as tk
     from tkinter import filedialog, messagebox, ttk
 except ImportError:
@@ -608,6 +1206,16 @@ class AdvancedSeleniumScraperApp(tk.Tk):
 
         self.data: List[Dict[str, str]] = []
 
+        # One reusable worker for scrape jobs: repeated scrapes share a thread
+        # instead of spawning a new one per click, and max_workers=1 means a
+        # second click queues behind a running scrape rather than racing it.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        # The title-bar X bypasses our destroy() override unless routed
+        # through the WM protocol; without this the warm Chrome would
+        # outlive the window on the most common exit path.
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
         self._build_ui()
 
         # Improve default look-and-feel where possible
@@ -731,13 +1339,24 @@ class AdvancedSeleniumScraperApp(tk.Tk):
 
     # ---------- Helpers ----------
 
+    def destroy(self):
+        # Close the warm browser together with the window and stop accepting
+        # new scrape jobs.
+        self._executor.shutdown(wait=False)
+        shutdown_driver()
+        super().destroy()
+
     def _set_status(self, text: str):
+        # The label is bound to the StringVar, so the mainloop repaints it on
+        # its next idle pass; forcing update_idletasks() here just made every
+        # status message trigger a full synchronous geometry recompute.
         self.status_var.set(text)
-        self.update_idletasks()
 
     def _start_progress(self):
         try:
-            self.progress.start(10)
+            # 50ms steps (~20 FPS) look identical for an indeterminate bar
+            # and cut the redraw load of the 10ms default by 5x.
+            self.progress.start(50)
         except Exception:
             pass
 
@@ -789,12 +1408,14 @@ class AdvancedSeleniumScraperApp(tk.Tk):
 
         self._set_status("Running… please watch the browser window and console.")
         self._start_progress()
-        t = threading.Thread(
-            target=self._run_scrape_thread,
-            args=(group_input, keyword, max_posts, cookies, only_sl),
-            daemon=True,
+        self._executor.submit(
+            self._run_scrape_thread,
+            group_input,
+            keyword,
+            max_posts,
+            cookies,
+            only_sl,
         )
-        t.start()
 
     def _run_scrape_thread(
         self,
@@ -828,19 +1449,15 @@ class AdvancedSeleniumScraperApp(tk.Tk):
             download_images_for_posts(posts, cookies=cookies or None)
 
             # Save CSV next to this script so the location is always clear
-            script_dir = Path(__file__).resolve().parent
-            out_path = script_dir / "fb_group_posts_selenium.csv"
-
-            save_posts_to_csv(posts, out_path)
+            save_posts_to_csv(posts, CSV_PATH)
             self.data = posts
 
             def update_ui():
                 self._populate_table()
                 self._stop_progress()
 
-                script_dir = Path(__file__).resolve().parent
-                csv_path = script_dir / "fb_group_posts_selenium.csv"
-                images_path = script_dir / "fb_images"
+                csv_path = CSV_PATH
+                images_path = IMG_DIR
 
                 self._set_status(
                     f"Done. Found {len(posts)} post(s). Data saved to {csv_path.name}."
@@ -870,60 +1487,89 @@ class AdvancedSeleniumScraperApp(tk.Tk):
             )
 
     def _populate_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        for p in self.data:
-            post_url = p.get("post_url", "")
-            text = (p.get("post_text", "") or "").replace("\n", " ")
-            short_text = text[:300]
-            image_paths = p.get("image_paths", "")
-            self.tree.insert(
-                "",
-                "end",
-                values=(post_url, short_text, image_paths),
+        # One delete call for all rows instead of one Tcl round-trip per row.
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        # Precompute the cleaned cell values outside the widget loop.
+        # Truncate before translating so the newline pass runs over at most
+        # 300 chars, not the whole post text.
+        rows = [
+            (
+                p.get("post_url", ""),
+                (p.get("post_text", "") or "")[:300].translate(NEWLINE_TABLE),
+                p.get("image_paths", ""),
             )
+            for p in self.data
+        ]
+
+        # Hide the columns while inserting so Tk does not relayout per row,
+        # then restore them for a single redraw at the end.
+        try:
+            self.tree.configure(displaycolumns=())
+            for values in rows:
+                self.tree.insert("", "end", values=values)
+        finally:
+            self.tree.configure(displaycolumns="#all")
 
     def _on_reload_results(self):
         # Reload the CSV from the same folder as this script
-        script_dir = Path(__file__).resolve().parent
-        path = script_dir / "fb_group_posts_selenium.csv"
+        path = CSV_PATH
         if not path.is_file():
             messagebox.showinfo(
                 "Info",
-                f"{path.name} not found in:\n{script_dir}",
+                f"{path.name} not found in:\n{SCRIPT_DIR}",
             )
             return
 
+        self._set_status("Reloading results…")
+        # Parse off the Tk thread so a large CSV does not freeze the window;
+        # the table swap happens back on the UI thread via after().
+        threading.Thread(
+            target=self._reload_worker, args=(path,), daemon=True
+        ).start()
+
+    def _reload_worker(self, path: Path):
         try:
-            data: List[Dict[str, str]] = []
             with path.open("r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    data.append(row)
+                data = list(csv.DictReader(f))
+        except Exception as e:
+            self.after(
+                0,
+                lambda msg=str(e): (
+                    self._set_status("Reload failed."),
+                    messagebox.showerror("Error", f"Failed to reload CSV: {msg}"),
+                ),
+            )
+            return
+
+        def update_ui():
             self.data = data
             self._populate_table()
-            self._set_status(
-                f"Reloaded {len(data)} row(s) from fb_group_posts_selenium.csv."
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to reload CSV: {e}")
+            self._set_status(f"Reloaded {len(data)} row(s) from {path.name}.")
+
+        self.after(0, update_ui)
 
     def _on_open_output(self):
         """
         Open the folder where the script (and CSV/images) live, not the OS user home.
         """
         # Use the directory of this script file as the output folder base.
-        script_dir = Path(__file__).resolve().parent
-        folder = script_dir
+        folder = SCRIPT_DIR
 
         try:
             if sys.platform.startswith("win"):
                 os.startfile(str(folder))  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
-                os.system(f'open "{folder}"')
             else:
-                os.system(f'xdg-open "{folder}"')
+                # Invoke the opener directly instead of via os.system: no
+                # shell fork, and paths with spaces/quotes need no escaping.
+                subprocess.Popen(
+                    [FOLDER_OPENER, str(folder)],
+                    close_fds=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder: {e}")
 
@@ -966,13 +1612,18 @@ def run_selenium_scrape(
         cookies = load_netscape_cookies(cookies_path)
         print(f"[INFO] Loaded {len(cookies)} cookies from {cookies_path}")
 
-    posts = selenium_collect_posts(
-        group_input=group_input,
-        keyword=keyword,
-        max_posts=max_posts,
-        cookies=cookies or None,
-        only_sl_phones=only_sl_phones,
-    )
+    try:
+        posts = selenium_collect_posts(
+            group_input=group_input,
+            keyword=keyword,
+            max_posts=max_posts,
+            cookies=cookies or None,
+            only_sl_phones=only_sl_phones,
+        )
+    finally:
+        # One-shot like the CLI: the browser must not outlive the call, even
+        # when collection raises.
+        shutdown_driver()
     if not posts:
         print("[INFO] No posts collected, nothing to save.")
         return
@@ -980,12 +1631,9 @@ def run_selenium_scrape(
     download_images_for_posts(posts, cookies=cookies or None)
 
     # Save CSV next to this script
-    script_dir = Path(__file__).resolve().parent
-    out_path = script_dir / "fb_group_posts_selenium.csv"
-
-    save_posts_to_csv(posts, out_path)
-    print(f"[INFO] Saved results to {out_path}")
-    print(f"[INFO] Images (if any) are in: {script_dir / 'fb_images'}")
+    save_posts_to_csv(posts, CSV_PATH)
+    print(f"[INFO] Saved results to {CSV_PATH}")
+    print(f"[INFO] Images (if any) are in: {IMG_DIR}")
 
 
 if __name__ == "__main__":